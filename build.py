@@ -8,14 +8,17 @@ import subprocess
 import site
 import importlib
 from pathlib import Path
-import glob
 import json
 
 # ---------- CONFIG ----------
 SCRIPT_NAME = "edge_tts_service.py"
 EXE_NAME = "edge_tts_service"
-ONEFILE = True
+# --onefile unpacks the whole bundle to %TEMP% on every start; --onedir starts
+# immediately. Set EDGE_TTS_ONEFILE=1 to build a single self-extracting exe anyway.
+ONEFILE = os.environ.get("EDGE_TTS_ONEFILE", "0") == "1"
 CONSOLE = True
+EDGE_TTS_MIN_MAJOR = 7
+OPTIMIZE = 2  # bundle .pyc compiled with -OO
 
 HIDDEN_IMPORTS = [
     "edge_tts",
@@ -23,6 +26,15 @@ HIDDEN_IMPORTS = [
     "edge_tts.list_voices",
     "websockets",
     "asyncio",
+    "av",
+]
+
+EXCLUDE_MODULES = [
+    "tkinter",
+    "unittest",
+    "pydoc_data",
+    "test",
+    "lib2to3",
 ]
 
 DATA_FILES = []
@@ -37,6 +49,14 @@ def ensure_package(pkg: str):
         return False
 
 
+def installed_major(dist: str):
+    try:
+        from importlib.metadata import version
+        return int(version(dist).split(".")[0])
+    except Exception:
+        return None
+
+
 def pip_install(packages):
     cmd = [sys.executable, "-m", "pip", "install", "--upgrade"] + packages
     print("Running:", " ".join(cmd))
@@ -58,11 +78,19 @@ def find_pywin32_binaries():
         pythoncom_path = Path(pythoncom.__file__).resolve().parent
 
         # Typical DLL names: pywintypes39.dll / pythoncom39.dll or with cp311 tags.
-        # Use glob to find the matching DLLs in the parent dirs.
+        # Scan each distinct parent dir once for both name patterns.
+        folders = {pyw_path, pythoncom_path}
+        site_packages = Path(sys.base_prefix) / "Lib" / "site-packages"
+        if site_packages.is_dir():
+            folders.add(site_packages.resolve())
+
         candidates = []
-        for folder in {pyw_path, pythoncom_path, Path(sys.base_prefix) / "Lib" / "site-packages"}:
-            for name in ("pywintypes*.dll", "pythoncom*.dll"):
-                candidates.extend(glob.glob(str(folder / name)))
+        for folder in folders:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    name = entry.name.lower()
+                    if name.endswith(".dll") and name.startswith(("pywintypes", "pythoncom")):
+                        candidates.append(entry.path)
 
         # Deduplicate and create pairs ("src;dest")
         unique = sorted(set(candidates))
@@ -78,14 +106,27 @@ def find_pywin32_binaries():
 
 
 def build():
-    if not ensure_package("PyInstaller"):
+    # Checked via package metadata so an outdated PyInstaller is not imported
+    # before it gets upgraded
+    major = installed_major("pyinstaller")
+    if major is None:
         print("PyInstaller not found; installing it...")
-        pip_install(["pyinstaller"])
+        pip_install(["pyinstaller>=6.0"])
+    elif major < 6:
+        print(f"PyInstaller {major}.x found; upgrading (--optimize needs PyInstaller 6)...")
+        pip_install(["pyinstaller>=6.0"])
 
     required_build = []
-    for pkg in ("websockets", "edge_tts"):
+    # edge-tts 7 added the connector= keyword the service passes to Communicate/list_voices
+    edge_tts_major = installed_major("edge-tts")
+    if edge_tts_major is not None and edge_tts_major < EDGE_TTS_MIN_MAJOR:
+        print(f"edge-tts {edge_tts_major}.x found; upgrading to >={EDGE_TTS_MIN_MAJOR}.0...")
+        pip_install([f"edge-tts>={EDGE_TTS_MIN_MAJOR}.0"])
+
+    # av: in-process MP3 decoder; without it the exe falls back to an external ffmpeg
+    for pkg in ("websockets", "edge_tts", "av"):
         if not ensure_package(pkg):
-            required_build.append(pkg)
+            required_build.append(f"edge-tts>={EDGE_TTS_MIN_MAJOR}.0" if pkg == "edge_tts" else pkg)
 
     if required_build:
         print("Installing missing runtime requirements for packaging:", required_build)
@@ -113,10 +154,14 @@ def build():
         pyinstaller_args.append("--noconsole")
 
     pyinstaller_args += ["--name", EXE_NAME, "--clean", "--log-level=INFO"]
+    pyinstaller_args += ["--optimize", str(OPTIMIZE)]
 
     for h in HIDDEN_IMPORTS:
         pyinstaller_args += ["--hidden-import", h]
 
+    for m in EXCLUDE_MODULES:
+        pyinstaller_args += ["--exclude-module", m]
+
     for src, dest in add_binary_pairs:
         # PyInstaller expects "SRC;DEST"
         pair = f"{src};{dest}"
@@ -135,14 +180,14 @@ def build():
         print("PyInstaller failed:", e)
         raise
 
-    dist_path = Path("dist") / f"{EXE_NAME}.exe" if ONEFILE else Path("dist") / EXE_NAME
+    dist_path = Path("dist") / f"{EXE_NAME}.exe" if ONEFILE else Path("dist") / EXE_NAME / f"{EXE_NAME}.exe"
     print("\nBuild complete!")
     print("Executable:", dist_path.resolve())
     return dist_path.resolve()
 
 
 if __name__ == "__main__":
-    print("Building", SCRIPT_NAME, "into single exe", EXE_NAME)
+    print("Building", SCRIPT_NAME, "into", "single exe" if ONEFILE else "folder", EXE_NAME)
     # Sanity check: script exists
     if not Path(SCRIPT_NAME).exists():
         print(f"Error: {SCRIPT_NAME} not found in current directory: {Path.cwd()}")
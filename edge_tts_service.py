@@ -3,9 +3,23 @@ import sys
 import os
 import json
 import asyncio
+import functools
 import signal
+import stat
+import threading
 import logging
 import struct
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ---------- Logging & binary stdout ----------
 
@@ -13,7 +27,10 @@ logger = logging.getLogger("tts_service")
 handler = logging.StreamHandler(sys.stderr)
 handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
 logger.addHandler(handler)
-logger.setLevel(logging.INFO)
+# The JSON status lines already carry per-utterance data; LOG_LEVEL=WARNING
+# silences the human-readable log lines interleaved with them on stderr
+log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+logger.setLevel(log_level if log_level in logging.getLevelNamesMapping() else logging.INFO)
 
 if os.name == "nt":
     try:
@@ -24,20 +41,275 @@ if os.name == "nt":
 
 # ---------- Utilities ----------
 
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
 def send_status(obj: dict) -> None:
     try:
-        sys.stderr.write(json.dumps(obj) + "\n")
-        sys.stderr.flush()
+        send_status_line(_dumps(obj) + b"\n")
+    except Exception:
+        pass
+
+def send_status_line(line: bytes) -> None:
+    try:
+        sys.stderr.flush()  # keep ordering with text written by the logging handler
+        sys.stderr.buffer.write(line)
+        sys.stderr.buffer.flush()
     except Exception:
         pass
 
+def _flush_stdout() -> None:
+    # Push out any PCM still buffered before a terminal status line
+    try:
+        sys.stdout.buffer.flush()
+    except Exception:
+        pass
+
+def _is_pollable(stream) -> bool:
+    # Only pipes and sockets go on the event loop. Regular files cannot be watched
+    # (uvloop aborts outright instead of raising); character devices either fail to
+    # register later inside a loop callback (/dev/null) or, for a TTY, get O_NONBLOCK
+    # set on an open file usually shared with stdout/stderr
+    try:
+        mode = os.fstat(stream.fileno()).st_mode
+    except Exception:
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
+
+def send_speaking(request_ts: float, voice: str) -> None:
+    # Sent once per utterance right before synthesis; built from static fragments
+    # instead of encoding a dict
+    send_status_line(
+        b'{"status":"speaking","ts":"' + _now_iso().encode("ascii")
+        + b'","request_ts":' + _dumps(request_ts)
+        + b',"voice":' + _dumps(voice) + b'}\n'
+    )
+
+# ---------- MP3 decoding ----------
+
+PCM_SAMPLE_RATE = 24000
+PCM_CHUNK_SIZE = 19200  # 400ms at 24kHz mono 16-bit
+FFMPEG_DRAIN_INTERVAL = 8  # MP3 chunks written to ffmpeg between drain() calls
+FFMPEG_BATCH_CHUNKS = 4  # MP3 chunks coalesced into one writelines() call
+FFMPEG_BATCH_DELAY = 0.02  # seconds a partial batch may wait for more chunks
+# sample_rate (4 bytes), channels (2 bytes), num_samples (4 bytes)
+PCM_HEADER = struct.Struct('<IHI')
+PCM_HEADER_SIZE = PCM_HEADER.size
+
+
+@functools.cache
+def load_av():
+    """Import PyAV on first use (it loads the libav* shared libraries); None if not installed."""
+    try:
+        import av
+        return av
+    except ImportError:
+        return None
+
+
+class Mp3Decoder:
+    """Incremental in-process MP3 -> s16le mono PCM decoder (PyAV)."""
+
+    def __init__(self):
+        av = load_av()
+        self._codec = av.CodecContext.create("mp3", "r")
+        self._resampler = av.AudioResampler(format="s16", layout="mono", rate=PCM_SAMPLE_RATE)
+
+    def decode(self, data: bytes, pcm: bytearray) -> None:
+        """Decode an MP3 fragment, appending the PCM it completes to pcm."""
+        frames = []
+        for packet in self._codec.parse(data):
+            frames.extend(self._codec.decode(packet))
+        self._resample(frames, pcm)
+
+    def flush(self, pcm: bytearray) -> None:
+        # Drain the parser, decoder and resampler at end of stream
+        frames = []
+        for packet in self._codec.parse(None):
+            frames.extend(self._codec.decode(packet))
+        frames.extend(self._codec.decode(None))
+        frames.append(None)
+        self._resample(frames, pcm)
+
+    def _resample(self, frames, pcm: bytearray) -> None:
+        for frame in frames:
+            for out_frame in self._resampler.resample(frame):
+                # Copy straight out of the frame's buffer; planes may carry padding
+                with memoryview(out_frame.planes[0]) as plane:
+                    pcm += plane[:out_frame.samples * 2]
+
+
+def _emit_pcm_chunks(pending: bytearray, write_pcm, final: bool = False) -> int:
+    # Hands out views into pending instead of sliced copies; write_pcm copies them
+    # into its own output buffer. Returns the number of bytes consumed.
+    end = len(pending) if final else len(pending) - len(pending) % PCM_CHUNK_SIZE
+    with memoryview(pending) as view:
+        for i in range(0, end, PCM_CHUNK_SIZE):
+            with view[i:min(i + PCM_CHUNK_SIZE, end)] as chunk:
+                write_pcm(chunk)
+    return end
+
+
+async def decode_in_process(mp3_chunks, write_pcm) -> None:
+    decoder = Mp3Decoder()
+    pending = bytearray()
+
+    started = False
+
+    async for data_bytes in mp3_chunks:
+        decoder.decode(data_bytes, pending)
+        if not started and pending:
+            # Send the first decoded audio as-is for time-to-first-audio; re-frame
+            # into PCM_CHUNK_SIZE chunks from then on
+            started = True
+            del pending[:_emit_pcm_chunks(pending, write_pcm, final=True)]
+        else:
+            del pending[:_emit_pcm_chunks(pending, write_pcm)]
+
+    decoder.flush(pending)
+    _emit_pcm_chunks(pending, write_pcm, final=True)
+
+
+async def decode_with_ffmpeg(mp3_chunks, write_pcm) -> None:
+    # Fallback when PyAV is not installed: transcode through an ffmpeg subprocess
+    # Single-threaded decode and an explicit input format: the input arrives in
+    # small chunks, so thread sync and format probing only add first-audio latency
+    ffmpeg_process = await asyncio.create_subprocess_exec(
+        'ffmpeg', '-hide_banner', '-loglevel', 'quiet', '-nostdin', '-threads', '1',
+        '-f', 'mp3', '-i', 'pipe:0',
+        '-f', 's16le', '-ar', str(PCM_SAMPLE_RATE), '-ac', '1', '-vn', 'pipe:1',
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+
+    # Task to feed MP3 data to ffmpeg. Chunks arriving in a burst are handed to the
+    # pipe together via writelines(); a timer bounds how long a partial batch waits.
+    # The transport buffers writes, so drain() only runs every few chunks.
+    async def feed_ffmpeg():
+        loop = asyncio.get_running_loop()
+        pending: list[bytes] = []
+        flush_handle: asyncio.TimerHandle | None = None
+
+        def flush_pending():
+            nonlocal flush_handle
+            if flush_handle is not None:
+                flush_handle.cancel()
+                flush_handle = None
+            if pending:
+                ffmpeg_process.stdin.writelines(pending)
+                pending.clear()
+
+        try:
+            received = 0
+            async for data_bytes in mp3_chunks:
+                pending.append(data_bytes)
+                received += 1
+                # The first chunk goes out immediately for time-to-first-audio
+                if received == 1 or len(pending) >= FFMPEG_BATCH_CHUNKS:
+                    flush_pending()
+                elif flush_handle is None:
+                    flush_handle = loop.call_later(FFMPEG_BATCH_DELAY, flush_pending)
+                if received % FFMPEG_DRAIN_INTERVAL == 0:
+                    await ffmpeg_process.stdin.drain()
+            flush_pending()
+            await ffmpeg_process.stdin.drain()
+        finally:
+            if flush_handle is not None:
+                flush_handle.cancel()
+            ffmpeg_process.stdin.close()
+            try:
+                await ffmpeg_process.stdin.wait_closed()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    # Task to read PCM from ffmpeg
+    async def read_pcm():
+        while True:
+            pcm_data = await ffmpeg_process.stdout.read(PCM_CHUNK_SIZE)
+            if not pcm_data:
+                break
+            write_pcm(pcm_data)
+
+    try:
+        # A failure on either side cancels the other
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(feed_ffmpeg())
+            tg.create_task(read_pcm())
+
+        # Wait for ffmpeg to finish
+        await ffmpeg_process.wait()
+    except ExceptionGroup as eg:
+        # Surface the first failure on its own; any others are logged, not lost
+        for extra in eg.exceptions[1:]:
+            logger.error("ffmpeg pipeline error: %s", extra)
+        raise eg.exceptions[0] from None
+    finally:
+        if ffmpeg_process.returncode is None:
+            ffmpeg_process.kill()
+            await ffmpeg_process.wait()
+
 # ---------- Core Service ----------
 
+_edge_tts = None
+
+def load_edge_tts():
+    """Import edge_tts on first use; it pulls in aiohttp, certifi and friends."""
+    global _edge_tts
+    if _edge_tts is None:
+        import edge_tts
+        _edge_tts = edge_tts
+    return _edge_tts
+
+def prewarm_imports() -> None:
+    try:
+        load_av()
+        load_edge_tts()
+    except Exception as e:
+        logger.warning("import prewarm failed: %s", e)
+
+@functools.cache
+def shared_connector_type():
+    import aiohttp
+
+    class SharedConnector(aiohttp.TCPConnector):
+        """TCPConnector that survives the per-request ClientSession edge_tts opens and
+        closes, so DNS results and pooled connections carry over between requests."""
+
+        async def close(self, *args, **kwargs) -> None:
+            # Called by edge_tts' session on exit; the service closes it via aclose()
+            pass
+
+        async def aclose(self) -> None:
+            await super().close()
+
+    return SharedConnector
+
+VOICES_TTL = 3600  # seconds; the voice catalogue changes rarely
+DNS_CACHE_TTL = 300  # seconds; resolved Edge TTS endpoints kept by the shared connector
+STDIN_LINE_LIMIT = 16 * 1024 * 1024  # speak commands can carry long texts
+
 class TTSService:
     def __init__(self):
         self._running = True
         self._current_task: asyncio.Task | None = None
         self._current_voice: str = "en-US-AriaNeural"
+        # (monotonic fetch time, serialized "voices" status line, voice count)
+        self._voices_cache: tuple[float, bytes, int] | None = None
+        self._connector: aiohttp.TCPConnector | None = None
 
         for sig in (signal.SIGINT, signal.SIGTERM):
             try:
@@ -53,19 +325,21 @@ class TTSService:
             pass
 
     async def run(self):
-        import time
-        from datetime import datetime, timezone
-
-        def now_iso():
-            return datetime.now(timezone.utc).isoformat()
-
-        send_status({"status": "ready", "ts": now_iso()})
+        send_status({"status": "ready", "ts": _now_iso()})
         logger.info("Service ready")
 
+        # Load PyAV and edge_tts off the event loop so "ready" does not wait for them
         loop = asyncio.get_running_loop()
+        loop.run_in_executor(None, prewarm_imports)
+
+        readline = await self._open_stdin()
         while self._running:
             try:
-                raw = await loop.run_in_executor(None, sys.stdin.buffer.readline)
+                raw = await readline()
+            except ValueError as e:
+                # Line longer than STDIN_LINE_LIMIT; the reader discards it
+                send_status({"status": "error", "message": f"command too long: {e}"})
+                continue
             except Exception as e:
                 logger.exception("stdin error: %s", e)
                 break
@@ -74,18 +348,12 @@ class TTSService:
                 logger.info("stdin closed")
                 break
 
-            try:
-                line = raw.rstrip(b"\r\n")
-                line_s = line.decode("utf-8", errors="replace")
-            except Exception as e:
-                send_status({"status": "error", "message": f"stdin decode failed: {e}"})
-                continue
-
-            if not line_s:
+            line = raw.rstrip(b"\r\n")
+            if not line:
                 continue
 
             try:
-                msg = json.loads(line_s)
+                msg = _loads(line)
             except Exception as e:
                 send_status({"status": "error", "message": f"invalid json: {e}"})
                 continue
@@ -100,15 +368,19 @@ class TTSService:
                     await self._cancel_current()
 
                 self._current_voice = voice
+                # Wall clock for the client, loop monotonic clock for durations
                 request_ts = time.time()
-                self._current_task = asyncio.create_task(self._speak_and_stream(text, voice, rate, request_ts))
+                request_mono = loop.time()
+                self._current_task = asyncio.create_task(
+                    self._speak_and_stream(text, voice, rate, request_ts, request_mono)
+                )
 
             elif cmd == "cancel":
                 await self._cancel_current()
 
             elif cmd == "restart":
                 self._current_voice = msg.get("voice", self._current_voice)
-                send_status({"status": "ready", "ts": now_iso()})
+                send_status({"status": "ready", "ts": _now_iso()})
 
             elif cmd == "get_voices":
                 await self._get_voices()
@@ -121,138 +393,128 @@ class TTSService:
 
         await self.shutdown()
 
-    async def _speak_and_stream(self, text: str, voice: str, rate: int, request_ts: float):
-        import time
-        from datetime import datetime, timezone
-        
-        def now_iso():
-            return datetime.now(timezone.utc).isoformat()
+    async def _open_stdin(self):
+        """Return an async readline() for stdin that avoids a thread-pool hop per line."""
+        loop = asyncio.get_running_loop()
+
+        if os.name != "nt" and _is_pollable(sys.stdin):
+            try:
+                reader = asyncio.StreamReader(limit=STDIN_LINE_LIMIT)
+                await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+                return reader.readline
+            except Exception as e:
+                logger.debug("stdin pipe reader unavailable: %s", e)
+
+        # Windows pipes cannot be polled by the event loop: one long-lived thread
+        # blocks on readline() and hands complete lines over through a queue
+        queue: asyncio.Queue[bytes] = asyncio.Queue()
 
+        def pump():
+            while True:
+                try:
+                    line = sys.stdin.buffer.readline()
+                except Exception as e:
+                    logger.error("stdin error: %s", e)
+                    line = b""
+                try:
+                    loop.call_soon_threadsafe(queue.put_nowait, line)
+                except RuntimeError:
+                    return  # event loop already closed
+                if not line:
+                    return
+
+        threading.Thread(target=pump, name="stdin-reader", daemon=True).start()
+        return queue.get
+
+    def _get_connector(self) -> aiohttp.TCPConnector:
+        # Created lazily: the connector binds to the running event loop
+        if self._connector is None:
+            self._connector = shared_connector_type()(ttl_dns_cache=DNS_CACHE_TTL)
+        return self._connector
+
+    async def _speak_and_stream(self, text: str, voice: str, rate: int, request_ts: float, request_mono: float):
         if not text:
-            send_status({"status": "error", "message": "empty text", "ts": now_iso()})
+            send_status({"status": "error", "message": "empty text", "ts": _now_iso()})
             return
 
-        send_status({"status": "speaking", "ts": now_iso(), "request_ts": request_ts, "voice": voice})
-        logger.info("Starting synthesis (voice=%s, rate=%+d)", voice, rate)
+        send_speaking(request_ts, voice)
 
         try:
-            import edge_tts
-            communicate = edge_tts.Communicate(text, voice, rate=f"{rate * 5:+d}%")
+            communicate = load_edge_tts().Communicate(
+                text, voice, rate=f"{rate * 5:+d}%", connector=self._get_connector()
+            )
         except Exception as e:
             logger.exception("edge_tts init failed: %s", e)
-            send_status({"status": "error", "message": f"init failed: {e}", "ts": now_iso()})
+            send_status({"status": "error", "message": f"init failed: {e}", "ts": _now_iso()})
             return
 
         try:
             out = sys.stdout.buffer
+            # Resolved once; used on every chunk
+            write, flush = out.write, out.flush
+            monotonic = asyncio.get_running_loop().time
             first_chunk_time = None
             chunk_count = 0
             pcm_chunks_sent = 0
-            
-            # Start ffmpeg using asyncio subprocess
-            ffmpeg_process = await asyncio.create_subprocess_exec(
-                'ffmpeg', '-i', 'pipe:0', '-f', 's16le', '-acodec', 'pcm_s16le',
-                '-ar', '24000', '-ac', '1', 'pipe:1',
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.DEVNULL
-            )
-            
-            # Task to feed MP3 data to ffmpeg
-            async def feed_ffmpeg():
-                nonlocal first_chunk_time, chunk_count
-                try:
-                    async for chunk in communicate.stream():
-                        if asyncio.current_task().cancelled():
-                            raise asyncio.CancelledError()
-
-                        data_bytes = None
-                        if isinstance(chunk, (bytes, bytearray)):
-                            data_bytes = bytes(chunk)
-                        elif isinstance(chunk, dict):
-                            if "data" in chunk:
-                                data_bytes = bytes(chunk["data"])
-                            elif "audio" in chunk:
-                                data_bytes = bytes(chunk["audio"])
-
-                        if not data_bytes:
-                            continue
-
-                        if first_chunk_time is None:
-                            first_chunk_time = time.time()
-                            send_status({
-                                "status": "first_audio",
-                                "ts": now_iso(),
-                                "first_audio_ms": int((first_chunk_time - request_ts) * 1000)
-                            })
-
-                        # Feed MP3 to ffmpeg
-                        ffmpeg_process.stdin.write(data_bytes)
-                        await ffmpeg_process.stdin.drain()
-                        chunk_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error feeding ffmpeg: {e}")
-                finally:
-                    ffmpeg_process.stdin.close()
-                    await ffmpeg_process.stdin.wait_closed()
-            
-            # Task to read PCM from ffmpeg
-            async def read_pcm():
+            pcm_buf = bytearray(PCM_HEADER_SIZE + PCM_CHUNK_SIZE)
+
+            def write_pcm(pcm_data: bytes | memoryview):
                 nonlocal pcm_chunks_sent
-                pcm_chunk_size = 4800  # 100ms at 24kHz mono 16-bit
-                
-                while True:
-                    try:
-                        pcm_data = await ffmpeg_process.stdout.read(pcm_chunk_size)
-                        if not pcm_data:
-                            break
-                        
-                        # Send header: sample_rate (4 bytes), channels (2 bytes), num_samples (4 bytes)
-                        num_samples = len(pcm_data) // 2
-                        header = struct.pack('<IHI', 24000, 1, num_samples)
-                        out.write(header)
-                        out.write(pcm_data)
-                        out.flush()
-                        pcm_chunks_sent += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Error reading PCM: {e}")
-                        break
-            
-            # Run both tasks concurrently
-            await asyncio.gather(feed_ffmpeg(), read_pcm())
-            
-            # Wait for ffmpeg to finish
-            await ffmpeg_process.wait()
+                # Header and payload go out in a single write, flushed right away so
+                # short chunks never linger in stdout's buffer
+                size = len(pcm_data)
+                PCM_HEADER.pack_into(pcm_buf, 0, PCM_SAMPLE_RATE, 1, size // 2)
+                pcm_buf[PCM_HEADER_SIZE:PCM_HEADER_SIZE + size] = pcm_data
+                write(memoryview(pcm_buf)[:PCM_HEADER_SIZE + size])
+                flush()
+                pcm_chunks_sent += 1
+
+            async def mp3_chunks():
+                nonlocal first_chunk_time, chunk_count
+                async for chunk in communicate.stream():
+                    # edge_tts yields dicts; only "audio" ones carry MP3 bytes
+                    if chunk.get("type") != "audio":
+                        continue
+                    data_bytes = chunk["data"]
+                    if not data_bytes:
+                        continue
+
+                    if first_chunk_time is None:
+                        first_chunk_time = monotonic()
+                        send_status({
+                            "status": "first_audio",
+                            "ts": _now_iso(),
+                            "first_audio_ms": int((first_chunk_time - request_mono) * 1000)
+                        })
+
+                    chunk_count += 1
+                    yield data_bytes
+
+            if load_av() is not None:
+                await decode_in_process(mp3_chunks(), write_pcm)
+            else:
+                await decode_with_ffmpeg(mp3_chunks(), write_pcm)
 
-            finished_ts = time.time()
-            synthesis_ms = int((finished_ts - request_ts) * 1000)
+            synthesis_ms = int((monotonic() - request_mono) * 1000)
 
             send_status({
                 "status": "finished",
-                "ts": now_iso(),
+                "ts": _now_iso(),
                 "synthesis_ms": synthesis_ms,
                 "chunks": chunk_count,
                 "pcm_chunks": pcm_chunks_sent
             })
-            logger.info("Synthesis finished: mp3_chunks=%d, pcm_chunks=%d, synth_ms=%d", 
-                       chunk_count, pcm_chunks_sent, synthesis_ms)
 
         except asyncio.CancelledError:
             logger.info("Cancelled")
-            if 'ffmpeg_process' in locals():
-                ffmpeg_process.kill()
-                await ffmpeg_process.wait()
-            send_status({"status": "cancelled", "ts": now_iso()})
+            _flush_stdout()
+            send_status({"status": "cancelled", "ts": _now_iso()})
             raise
 
         except Exception as e:
             logger.exception("Synthesis error: %s", e)
-            if 'ffmpeg_process' in locals():
-                ffmpeg_process.kill()
-                await ffmpeg_process.wait()
-            send_status({"status": "error", "message": str(e), "ts": now_iso()})
+            _flush_stdout()
+            send_status({"status": "error", "message": str(e), "ts": _now_iso()})
 
     async def _cancel_current(self):
         task = self._current_task
@@ -269,10 +531,15 @@ class TTSService:
         send_status({"status": "cancelled"})
 
     async def _get_voices(self):
+        cache = self._voices_cache
+        if cache and time.monotonic() - cache[0] < VOICES_TTL:
+            send_status_line(cache[1])
+            logger.info("Returned %d cached voices", cache[2])
+            return
+
         logger.info("Fetching voices")
         try:
-            import edge_tts
-            voices = await edge_tts.list_voices()
+            voices = await load_edge_tts().list_voices(connector=self._get_connector())
 
             voice_list = []
             for v in voices:
@@ -283,7 +550,9 @@ class TTSService:
                     "gender": v.get("Gender"),
                 })
 
-            send_status({"status": "voices", "voices": voice_list})
+            line = _dumps({"status": "voices", "voices": voice_list}) + b"\n"
+            self._voices_cache = (time.monotonic(), line, len(voice_list))
+            send_status_line(line)
             logger.info("Returned %d voices", len(voice_list))
 
         except Exception as e:
@@ -301,8 +570,17 @@ class TTSService:
             try:
                 self._current_task.cancel()
                 await self._current_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                pass
+
+        if self._connector is not None:
+            try:
+                await self._connector.aclose()
             except Exception:
                 pass
+            self._connector = None
 
         send_status({"status": "shutdown"})
 
@@ -312,10 +590,21 @@ class TTSService:
         except Exception:
             pass
 
+def _event_loop_factory():
+    # uvloop has no Windows build; elsewhere use it when installed
+    if os.name != "nt":
+        try:
+            import uvloop
+            return uvloop.new_event_loop
+        except ImportError:
+            pass
+    return None
+
 def main():
     service = TTSService()
     try:
-        asyncio.run(service.run())
+        with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+            runner.run(service.run())
     except KeyboardInterrupt:
         pass
     except Exception: